@@ -1,18 +1,34 @@
 import os
 import re
 import json
-import arxiv
+import orjson
 import yaml
 import logging
 import argparse
 import datetime
 import requests
 import time
+import random
+import functools
+import hashlib
+import sqlite3
+import threading
+import tempfile
+import asyncio
+import aiohttp
+import aiofiles
 from pathlib import Path
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 try:
     from openai import OpenAI  # For qwen-long via DashScope compatible API
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    # Worth retrying; auth and bad-request errors are not
+    _QWEN_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
 except Exception:
     OpenAI = None
+    APITimeoutError = None
+    _QWEN_RETRYABLE_ERRORS = ()
 from requests.exceptions import SSLError, RequestException, ConnectionError, Timeout
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -21,19 +37,84 @@ logging.basicConfig(format='[%(asctime)s %(levelname)s] %(message)s',
                     datefmt='%m/%d/%Y %H:%M:%S',
                     level=logging.INFO)
 
+# LaTeX span in a paper row, see json_to_md
+_MATH_RE = re.compile(r"\$.*\$")
+# Characters not allowed in local file names, see sanitize_filename
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]")
+
 base_url = "https://arxiv.paperswithcode.com/api/v0/papers/"
 github_url = "https://api.github.com/search/repositories"
 arxiv_url = "http://arxiv.org/"
+arxiv_api_url = "https://export.arxiv.org/api/query"
+
+# arXiv API paging, see search_today_papers; the API terms ask for one
+# connection at a time and 3 s between requests
+ARXIV_PAGE_SIZE = 100
+ARXIV_API_DELAY_SECONDS = 3
+ARXIV_EMPTY_PAGE_RETRIES = 3
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+
+# Max simultaneous connections per host for the async fetchers
+HOST_CONCURRENCY = 8
+# PDFs are streamed to disk in chunks of this size
+PDF_CHUNK_SIZE = 65536
+# qwen-long summaries are cached here, one text file per paper
+SUMMARY_DIR = "summaries"
+# Max qwen-long summarizations in flight, kept under the DashScope rate limit
+QWEN_LONG_CONCURRENCY = 5
+QWEN_LONG_MAX_ATTEMPTS = 3
+# Summaries need both the openai package and a DashScope key, checked once
+SUMMARIZATION_ENABLED = OpenAI is not None and bool(os.getenv("DASHSCOPE_API_KEY"))
+
+# Dedicated pool for the sync OpenAI SDK, caps concurrent LLM calls
+_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=QWEN_LONG_CONCURRENCY)
+
+# Per-run async state, shared by all topics: in-flight request limits per
+# service, and the in-flight downloads and summaries so a paper shared by
+# several topics is fetched and summarized once. asyncio primitives bind to
+# the first event loop that waits on them, so get_all_daily_papers rebuilds
+# all of it for every asyncio.run via _reset_run_state.
+_pdf_tasks = dict()
+_summary_tasks = dict()
+
+
+def _reset_run_state() -> None:
+    global _ARXIV_API_SEM, _ARXIV_PDF_SEM, _PWC_SEM, _DASHSCOPE_SEM, _arxiv_api_last_call
+    _ARXIV_API_SEM = asyncio.Semaphore(1)
+    _ARXIV_PDF_SEM = asyncio.Semaphore(4)
+    _PWC_SEM = asyncio.Semaphore(10)
+    _DASHSCOPE_SEM = asyncio.Semaphore(QWEN_LONG_CONCURRENCY)
+    _arxiv_api_last_call = 0.0
+    _pdf_tasks.clear()
+    _summary_tasks.clear()
+
+
+_reset_run_state()
+
+# Worker threads for the weekly paperswithcode link refresh
+LINK_UPDATE_WORKERS = 16
+
+# Persistent cache for paperswithcode lookups; a found repo link is kept much
+# longer than a miss, which is re-checked daily
+CACHE_DB_PATH = "cache.sqlite"
+CACHE_TTL_SECONDS = 86400
+CACHE_FOUND_TTL_SECONDS = 90 * 86400
+# Daily cache of arXiv search results, one file per query and day
+ARXIV_CACHE_DIR = os.path.join("cache", "arxiv")
+
+# Transient HTTP statuses worth retrying, for both requests and aiohttp
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 # Create a shared requests Session with retries for robustness
 session = requests.Session()
 retry_strategy = Retry(
     total=3,
     backoff_factor=0.5,
-    status_forcelist=[429, 500, 502, 503, 504],
+    status_forcelist=list(RETRY_STATUS_CODES),
     allowed_methods=["GET"],
 )
-adapter = HTTPAdapter(max_retries=retry_strategy)
+# one pooled connection per update_paper_links worker thread
+adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=LINK_UPDATE_WORKERS)
 session.mount("https://", adapter)
 session.mount("http://", adapter)
 
@@ -58,49 +139,254 @@ def get_json_with_retries(url: str, timeout_seconds: int = 10):
     return None
 
 
+async def get_text_with_retries_async(http: aiohttp.ClientSession, url: str, params: dict | None = None,
+                                      timeout_seconds: int = 10, backoff_seconds: float = 0.5):
+    """Fetch a response body as text on a shared aiohttp session, with retries.
+
+    Returns the body on success, or None on failure.
+    """
+    timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+    for attempt in range(1, 4):
+        try:
+            async with http.get(url, params=params, timeout=timeout) as resp:
+                resp.raise_for_status()
+                return await resp.text()
+        except asyncio.TimeoutError as e:
+            logging.warning(f"Connection/timeout on attempt {attempt} for {url}: {e}")
+        except aiohttp.ClientError as e:
+            logging.warning(f"Request error on attempt {attempt} for {url}: {e}")
+        await asyncio.sleep(backoff_seconds * attempt)
+    return None
+
+
+async def get_json_with_retries_async(http: aiohttp.ClientSession, url: str, timeout_seconds: int = 10):
+    """Async counterpart of get_json_with_retries on a shared aiohttp session.
+
+    Returns parsed JSON dict on success, or None on failure.
+    """
+    text = await get_text_with_retries_async(http, url, timeout_seconds=timeout_seconds)
+    if text is None:
+        return None
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError as e:
+        logging.warning(f"Invalid JSON from {url}: {e}")
+        return None
+
+
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache_conn() -> sqlite3.Connection:
+    global _cache_conn
+    if _cache_conn is None:
+        conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache "
+            "(key TEXT PRIMARY KEY, url TEXT, fetched_at INTEGER, body BLOB)"
+        )
+        conn.commit()
+        _cache_conn = conn
+    return _cache_conn
+
+
+def cache_get_json(url: str, ttl: int = CACHE_TTL_SECONDS):
+    """Return the cached JSON for url if still fresh, else None.
+
+    Misses expire after ttl seconds, responses with an official repo after
+    CACHE_FOUND_TTL_SECONDS.
+    """
+    key = hashlib.sha256(url.encode()).hexdigest()
+    try:
+        with _cache_lock:
+            row = _get_cache_conn().execute(
+                "SELECT fetched_at, body FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logging.warning(f"Cache read failed for {url}: {e}")
+        return None
+    if row is None:
+        return None
+    data = orjson.loads(row[1])
+    if isinstance(data, dict) and data.get("official"):
+        ttl = max(ttl, CACHE_FOUND_TTL_SECONDS)
+    if time.time() - row[0] > ttl:
+        return None
+    return data
+
+
+def cache_put_json(url: str, data) -> None:
+    key = hashlib.sha256(url.encode()).hexdigest()
+    body = orjson.dumps(data)
+    try:
+        with _cache_lock:
+            conn = _get_cache_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache (key, url, fetched_at, body) VALUES (?, ?, ?, ?)",
+                (key, url, int(time.time()), body),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logging.warning(f"Cache write failed for {url}: {e}")
+
+
+def cached_get_json(url: str, ttl: int = CACHE_TTL_SECONDS):
+    """get_json_with_retries backed by the sqlite cache."""
+    data = cache_get_json(url, ttl)
+    if data is not None:
+        return data
+    data = get_json_with_retries(url)
+    if data is not None:
+        cache_put_json(url, data)
+    return data
+
+
+async def cached_get_json_async(http: aiohttp.ClientSession, url: str, ttl: int = CACHE_TTL_SECONDS):
+    """get_json_with_retries_async backed by the sqlite cache."""
+    data = cache_get_json(url, ttl)
+    if data is not None:
+        return data
+    async with _PWC_SEM:
+        data = await get_json_with_retries_async(http, url)
+    if data is not None:
+        cache_put_json(url, data)
+    return data
+
+
 def ensure_dir(path: str) -> None:
     if not os.path.isdir(path):
         os.makedirs(path, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
-    return re.sub(r"[^A-Za-z0-9._-]", "_", name)
+    return _SANITIZE_RE.sub("_", name)
+
 
+def _shared_task(tasks: dict, key, func, *args):
+    """Start func(*args) once per key; every caller awaits the same task."""
+    if key not in tasks:
+        tasks[key] = asyncio.ensure_future(func(*args))
+    # one cancelled caller must not cancel the work for the others
+    return asyncio.shield(tasks[key])
 
-def download_pdf_for_paper(paper_key: str, dest_dir: str = "papers") -> str | None:
+
+async def download_pdf_for_paper(http: aiohttp.ClientSession, paper_key: str, dest_dir: str = "papers") -> str | None:
     """Download arXiv PDF for given paper key (e.g., 2508.17739) to dest_dir.
     Returns local file path or None on failure.
     """
+    return await _shared_task(_pdf_tasks, (dest_dir, paper_key), _download_pdf, http, paper_key, dest_dir)
+
+
+async def _download_pdf(http: aiohttp.ClientSession, paper_key: str, dest_dir: str) -> str | None:
     ensure_dir(dest_dir)
     pdf_url = f"https://arxiv.org/pdf/{paper_key}.pdf"
     local_path = os.path.join(dest_dir, f"{sanitize_filename(paper_key)}.pdf")
-    try:
-        resp = session.get(pdf_url, timeout=20)
-        resp.raise_for_status()
-        with open(local_path, "wb") as f:
-            f.write(resp.content)
-        logging.info(f"Downloaded PDF for {paper_key} -> {local_path}")
+    if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+        logging.info(f"PDF for {paper_key} already downloaded -> {local_path}")
         return local_path
-    except Exception as e:
-        logging.warning(f"Failed to download PDF for {paper_key} from {pdf_url}: {e}")
-        return None
+    # stream into a private temp file so a failed download never leaves a truncated PDF
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, prefix=f"{sanitize_filename(paper_key)}.", suffix=".part")
+    os.close(fd)
+    timeout = aiohttp.ClientTimeout(sock_connect=20, sock_read=20)
+    for attempt in range(1, 4):
+        try:
+            # each attempt rewrites the temp file from the start
+            async with _ARXIV_PDF_SEM, http.get(pdf_url, timeout=timeout) as resp:
+                resp.raise_for_status()
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    async for chunk in resp.content.iter_chunked(PDF_CHUNK_SIZE):
+                        await f.write(chunk)
+            os.replace(tmp_path, local_path)
+            logging.info(f"Downloaded PDF for {paper_key} -> {local_path}")
+            return local_path
+        except aiohttp.ClientResponseError as e:
+            logging.warning(f"HTTP {e.status} on attempt {attempt} for {pdf_url}")
+            if e.status not in RETRY_STATUS_CODES:
+                break
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            logging.warning(f"Request error on attempt {attempt} for {pdf_url}: {e}")
+        except Exception as e:
+            logging.warning(f"Failed to download PDF for {paper_key} from {pdf_url}: {e}")
+            break
+        await asyncio.sleep(0.5 * attempt)
+    logging.warning(f"Failed to download PDF for {paper_key} from {pdf_url}")
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    return None
+
+
+def save_summary(summary_path: str, text: str) -> None:
+    """Write a summary atomically so an interrupted run never leaves a partial file."""
+    summary_dir = os.path.dirname(summary_path)
+    ensure_dir(summary_dir)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=summary_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, summary_path)
+    except OSError as e:
+        logging.warning(f"Failed to cache summary to {summary_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client():
+    """One shared DashScope client, so its connection pool is reused across summaries.
+    SDK retries are off, call_qwen_with_retries is the only retry policy.
+    """
+    return OpenAI(api_key=os.getenv("DASHSCOPE_API_KEY"),
+                  base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
+                  max_retries=0)
+
+
+def call_qwen_with_retries(func, *args, retry_timeouts: bool = True, **kwargs):
+    """Call a DashScope client method, retrying transient failures with exponential backoff.
+
+    Runs on _LLM_EXECUTOR threads, so a blocking sleep is fine here.
+    Non-transient errors, and the last transient one, are raised to the caller.
+    With retry_timeouts=False a timeout is raised too, for calls that may
+    have succeeded server-side (e.g. uploads).
+    """
+    for attempt in range(QWEN_LONG_MAX_ATTEMPTS):
+        try:
+            return func(*args, **kwargs)
+        except _QWEN_RETRYABLE_ERRORS as e:
+            if attempt == QWEN_LONG_MAX_ATTEMPTS - 1:
+                raise
+            if not retry_timeouts and isinstance(e, APITimeoutError):
+                raise
+            delay = (2 ** attempt) + random.random()
+            logging.warning(f"qwen-long transient error on attempt {attempt + 1}: {e}; retrying in {delay:.1f}s")
+            time.sleep(delay)
 
 
 def summarize_pdf_with_qwen_long(pdf_path: str) -> str | None:
     """Summarize the PDF using qwen-long via DashScope-compatible OpenAI client.
     Reads API key from DASHSCOPE_API_KEY if available. Returns response dict or None.
+    Summaries are cached in SUMMARY_DIR, so each PDF is only sent to the LLM once.
     """
-    if OpenAI is None:
-        logging.warning("openai package not available; skipping summarization")
-        return None
-    api_key = os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
-        logging.warning("DASHSCOPE_API_KEY not set; skipping summarization")
+    summary_path = os.path.join(SUMMARY_DIR, f"{Path(pdf_path).stem}.txt")
+    if os.path.exists(summary_path):
+        with open(summary_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        if text:
+            logging.info(f"Loaded cached summary for {pdf_path} <- {summary_path}")
+            return text
+    if not SUMMARIZATION_ENABLED:
+        logging.warning("openai package or DASHSCOPE_API_KEY not available; skipping summarization")
         return None
     try:
-        client = OpenAI(api_key=api_key, base_url="https://dashscope.aliyuncs.com/compatible-mode/v1")
-        file_object = client.files.create(file=Path(pdf_path), purpose="file-extract")
-        completion = client.chat.completions.create(
+        client = _get_openai_client()
+        file_object = call_qwen_with_retries(
+            client.files.create, file=Path(pdf_path), purpose="file-extract",
+            retry_timeouts=False)  # a timed-out upload may still have landed
+        completion = call_qwen_with_retries(
+            client.chat.completions.create,
             model="qwen-long",
             messages=[
                 {"role": "system", "content": f"fileid://{file_object.id}"},
@@ -111,13 +397,13 @@ def summarize_pdf_with_qwen_long(pdf_path: str) -> str | None:
         # Extract text content robustly across return formats
         try:
             text = None
-            # Preferred: object with .choices
+            # Preferred: ChatCompletion with pydantic message objects
             if hasattr(completion, "choices"):
                 try:
-                    text = completion.choices[0].message.get("content")
+                    text = getattr(completion.choices[0].message, "content", None)
                 except Exception:
                     text = None
-            # Fallback: JSON string via model_dump_json
+            # Fallback: JSON string via model_dump_json, for unknown return shapes
             if text is None and hasattr(completion, "model_dump_json"):
                 try:
                     comp_json = json.loads(completion.model_dump_json())
@@ -130,6 +416,7 @@ def summarize_pdf_with_qwen_long(pdf_path: str) -> str | None:
             if not text:
                 raise ValueError("empty content from completion")
             logging.info(f"Summarization text extracted: {text}")
+            save_summary(summary_path, text)
             return text
         except Exception as e:
             logging.warning(f"Summarization failed for {pdf_path}: {e}")
@@ -138,6 +425,17 @@ def summarize_pdf_with_qwen_long(pdf_path: str) -> str | None:
         logging.warning(f"Summarization failed for {pdf_path}: {e}")
         return None
 
+async def summarize_pdf_with_qwen_long_async(pdf_path: str) -> str | None:
+    """Run the blocking qwen-long summarization on _LLM_EXECUTOR, off the event loop.
+    Each PDF is summarized at most once per run, even if several topics ask for it.
+    """
+    return await _shared_task(_summary_tasks, pdf_path, _summarize_pdf_async, pdf_path)
+
+async def _summarize_pdf_async(pdf_path: str) -> str | None:
+    loop = asyncio.get_running_loop()
+    async with _DASHSCOPE_SEM:
+        return await loop.run_in_executor(_LLM_EXECUTOR, summarize_pdf_with_qwen_long, pdf_path)
+
 def load_config(config_file:str) -> dict:
     '''
     config_file: input config file path
@@ -177,12 +475,8 @@ def get_authors(authors, first_author = False):
         output = authors[0]
     return output
 def sort_papers(papers):
-    output = dict()
-    keys = list(papers.keys())
-    keys.sort(reverse=True)
-    for key in keys:
-        output[key] = papers[key]
-    return output
+    # keys are unique, so ordering items compares keys only
+    return dict(sorted(papers.items(), reverse=True))
 import requests
 
 def get_code_link(qword:str) -> str:
@@ -206,109 +500,312 @@ def get_code_link(qword:str) -> str:
         code_link = results["items"][0]["html_url"]
     return code_link
 
-def get_daily_papers(topic,query="slam", max_results=2):
+def _arxiv_cache_path(query, max_results, day):
+    sha = hashlib.sha256(f"{query}\n{max_results}".encode()).hexdigest()
+    return os.path.join(ARXIV_CACHE_DIR, f"{sha}.{day.strftime('%Y%m%d')}.json")
+
+def load_arxiv_cache(query, max_results):
     """
-    @param topic: str
-    @param query: str
-    @return paper_with_code: dict
+    Return today's cached search records for query, or None.
+    Cache files from previous days are deleted on the way.
     """
-    # output
-    content = dict()
-    content_to_web = dict()
-    search_engine = arxiv.Search(
-        query = query,
-        max_results = max_results,
-        sort_by = arxiv.SortCriterion.SubmittedDate
-    )
+    if not os.path.isdir(ARXIV_CACHE_DIR):
+        return None
+    today = datetime.date.today()
+    suffix = f".{today.strftime('%Y%m%d')}.json"
+    for name in os.listdir(ARXIV_CACHE_DIR):
+        if name.endswith(".json") and not name.endswith(suffix):
+            os.remove(os.path.join(ARXIV_CACHE_DIR, name))
+    path = _arxiv_cache_path(query, max_results, today)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+def save_arxiv_cache(query, max_results, records):
+    ensure_dir(ARXIV_CACHE_DIR)
+    path = _arxiv_cache_path(query, max_results, datetime.date.today())
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(records))
 
+def parse_arxiv_feed(text):
+    """
+    Parse an arXiv API Atom feed.
+    @param text: str
+    @return records: list of dict, see search_today_papers
+    """
+    root = ET.fromstring(text)
+    records = []
+    for entry in root.findall("atom:entry", _ATOM_NS):
+        entry_id = entry.findtext("atom:id", "", _ATOM_NS).strip()
+        primary_category = entry.find("arxiv:primary_category", _ATOM_NS)
+        records.append({
+            "paper_id": entry_id.split("arxiv.org/abs/")[-1],
+            "title": re.sub(r"\s+", " ", entry.findtext("atom:title", "", _ATOM_NS)).strip(),
+            "authors": [author.findtext("atom:name", "", _ATOM_NS)
+                        for author in entry.findall("atom:author", _ATOM_NS)],
+            "abstract": entry.findtext("atom:summary", "", _ATOM_NS).strip(),
+            "url": entry_id,
+            "primary_category": primary_category.get("term") if primary_category is not None else None,
+            # timestamps look like 2024-01-31T18:59:59Z, keep the date part
+            "published": entry.findtext("atom:published", "", _ATOM_NS)[:10],
+            "updated": entry.findtext("atom:updated", "", _ATOM_NS)[:10],
+            "comment": entry.findtext("arxiv:comment", None, _ATOM_NS),
+        })
+    return records
+
+async def arxiv_search_async(http, query, start = 0, max_results = ARXIV_PAGE_SIZE):
+    """
+    One page of the arXiv API, newest submissions first.
+    @return records: list of dict, or None on failure
+    """
+    params = {
+        "search_query": query,
+        "start": start,
+        "max_results": max_results,
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+    }
+    global _arxiv_api_last_call
+    async with _ARXIV_API_SEM:
+        # the spacing is kept across all topics, not just between pages of one query
+        wait = _arxiv_api_last_call + ARXIV_API_DELAY_SECONDS - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            text = await get_text_with_retries_async(http, arxiv_api_url, params=params, timeout_seconds=30,
+                                                     backoff_seconds=ARXIV_API_DELAY_SECONDS)
+        finally:
+            _arxiv_api_last_call = time.monotonic()
+    if text is None:
+        return None
     try:
-        for result in search_engine.results():
-            
-            paper_id            = result.get_short_id()
-            paper_title         = result.title
-            paper_url           = result.entry_id
-            code_url            = base_url + paper_id #TODO
-            paper_abstract      = result.summary.replace("\n"," ")
-            paper_authors       = get_authors(result.authors)
-            paper_first_author  = get_authors(result.authors,first_author = True)
-            primary_category    = result.primary_category
-            publish_time        = result.published.date()
-            update_time         = result.updated.date()
-            comments            = result.comment
-
-            logging.info(f"Time = {publish_time} title = {paper_title} author = {paper_first_author}")
+        return parse_arxiv_feed(text)
+    except ET.ParseError as e:
+        logging.warning(f"Invalid arXiv feed for {query}: {e}")
+        return None
+
+async def fetch_arxiv_page(http, query, start, page_size):
+    """
+    arxiv_search_async, retrying an empty page past the first one, which
+    arXiv occasionally returns in the middle of a feed.
+    @return records: list of dict, or None on failure
+    """
+    for attempt in range(ARXIV_EMPTY_PAGE_RETRIES + 1):
+        if attempt > 0:
+            logging.warning(f"arXiv returned an unexpected empty page at offset {start} for {query}; retry {attempt}")
+        page = await arxiv_search_async(http, query, start, page_size)
+        # only the first page may legitimately be empty
+        if page is None or page or start == 0:
+            return page
+    return None
+
+async def search_today_papers(http, query, max_results):
+    """
+    Page through the arXiv API, stops at the first paper not published today.
+    Results are cached on disk for the rest of the day.
+    @param http: aiohttp.ClientSession
+    @param query: str
+    @param max_results: int
+    @return records: list of dict, newest first
+    """
+    records = load_arxiv_cache(query, max_results)
+    if records is not None:
+        logging.info(f"Loaded {len(records)} cached arXiv results for {query}")
+        return records
+
+    today = datetime.date.today().isoformat()
+    records = []
+    complete = True
+    start = 0
+    while start < max_results:
+        page_size = min(ARXIV_PAGE_SIZE, max_results - start)
+        page = await fetch_arxiv_page(http, query, start, page_size)
+        if page is None:
+            logging.error(f"arXiv query failed at offset {start} for {query}; "
+                          f"continuing with {len(records)} collected results, not cached.")
+            complete = False
+            break
+        if not page:
+            break
+        for record in page:
+            paper_first_author = get_authors(record["authors"],first_author = True)
+            logging.info(f"Time = {record['published']} title = {record['title']} author = {paper_first_author}")
 
             # Only process papers published today
-            if publish_time != datetime.date.today():
+            if record["published"] != today:
                 break
+            records.append(record)
+        # stop at the first older paper or at the end of the feed
+        if len(records) < start + len(page) or len(page) < page_size:
+            break
+        start += len(page)
+
+    # an empty day may simply not be announced yet, query again next run
+    if records and complete:
+        save_arxiv_cache(query, max_results, records)
+    return records
+
+async def fetch_paper(http, record):
+    """
+    Download the PDF and look up the code link of a single paper.
+    @param http: aiohttp.ClientSession
+    @param record: dict returned by search_today_papers
+    @return paper: dict, or None on failure
+    """
+    paper_id            = record["paper_id"]
+    paper_title         = record["title"]
+    paper_url           = record["url"]
+    code_url            = base_url + paper_id #TODO
+    paper_abstract      = record["abstract"].replace("\n"," ")
+    paper_authors       = get_authors(record["authors"])
+    paper_first_author  = get_authors(record["authors"],first_author = True)
+    primary_category    = record["primary_category"]
+    publish_time        = datetime.date.fromisoformat(record["published"])
+    update_time         = datetime.date.fromisoformat(record["updated"])
+    comments            = record["comment"]
+
+    # eg: 2108.09112v1 -> 2108.09112
+    ver_pos = paper_id.find('v')
+    if ver_pos == -1:
+        paper_key = paper_id
+    else:
+        paper_key = paper_id[0:ver_pos]
+    paper_url = arxiv_url + 'abs/' + paper_key
 
-            # eg: 2108.09112v1 -> 2108.09112
-            ver_pos = paper_id.find('v')
-            if ver_pos == -1:
-                paper_key = paper_id
-            else:
-                paper_key = paper_id[0:ver_pos]
-            paper_url = arxiv_url + 'abs/' + paper_key
-
-            try:
-                # 1) Download today's paper PDF
-                pdf_local_path = download_pdf_for_paper(paper_key)
-                # 2) Summarize with qwen-long if configured
-                summary_text = None
-                if pdf_local_path:
-                    summary_text = summarize_pdf_with_qwen_long(pdf_local_path)
-
-                # source code link
-                r = get_json_with_retries(code_url)
-                repo_url = None
-                if r and "official" in r and r["official"]:
-                    repo_url = r["official"]["url"]
-                # TODO: not found, two more chances
-                # else:
-                #    repo_url = get_code_link(paper_title)
-                #    if repo_url is None:
-                #        repo_url = get_code_link(paper_key)
-                if repo_url is not None:
-                    title_cell = paper_title
-                    if summary_text:
-                        title_cell = f"**{paper_title}**<br><br>{summary_text}"
-                    else:
-                        title_cell = f"**{paper_title}**"
-                    content[paper_key] = "|**{}**|{}|{} et.al.|[{}]({})|**[link]({})**|\n".format(
-                           publish_time,title_cell,paper_first_author,paper_key,paper_url,repo_url)
-                    content_to_web[paper_key] = "- {}, **{}**, {} et.al., Paper: [{}]({}), Code: **[{}]({})**".format(
-                           publish_time,paper_title,paper_first_author,paper_url,paper_url,repo_url,repo_url)
+    try:
+        # Download today's paper PDF (only needed for summaries) and the source code link together
+        if SUMMARIZATION_ENABLED:
+            pdf_local_path, r = await asyncio.gather(
+                download_pdf_for_paper(http, paper_key),
+                cached_get_json_async(http, code_url))
+        else:
+            pdf_local_path = None
+            r = await cached_get_json_async(http, code_url)
+
+        repo_url = None
+        if r and "official" in r and r["official"]:
+            repo_url = r["official"]["url"]
+        # TODO: not found, two more chances
+        # else:
+        #    repo_url = get_code_link(paper_title)
+        #    if repo_url is None:
+        #        repo_url = get_code_link(paper_key)
+    except Exception as e:
+        logging.warning(f"Fetch code link failed: {e} with id: {paper_key}")
+        return None
+
+    return {
+        "key": paper_key,
+        "title": paper_title,
+        "url": paper_url,
+        "first_author": paper_first_author,
+        "publish_time": publish_time,
+        "repo_url": repo_url,
+        "pdf_path": pdf_local_path,
+    }
 
-                else:
-                    title_cell = paper_title
-                    if summary_text:
-                        title_cell = f"**{paper_title}**<br><br>{summary_text}"
-                    else:
-                        title_cell = f"**{paper_title}**"
-                    content[paper_key] = "|**{}**|{}|{} et.al.|[{}]({})|null|\n".format(
-                           publish_time,title_cell,paper_first_author,paper_key,paper_url)
-                    content_to_web[paper_key] = "- {}, **{}**, {} et.al., Paper: [{}]({})".format(
-                           publish_time,paper_title,paper_first_author,paper_url,paper_url)
-
-                # TODO: select useful comments
-                comments = None
-                if comments != None:
-                    content_to_web[paper_key] += f", {comments}\n"
-                else:
-                    content_to_web[paper_key] += f"\n"
 
-            except Exception as e:
-                logging.warning(f"Fetch code link failed: {e} with id: {paper_key}")
-    except arxiv.UnexpectedEmptyPageError as e:
-        logging.warning(f"arXiv returned an unexpected empty page; continuing with collected results. Details: {e}")
+def chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def format_paper_rows(paper, summary_text = None):
+    """
+    @param paper: dict returned by fetch_paper
+    @param summary_text: str or None
+    @return (readme row, web row)
+    """
+    paper_key = paper["key"]
+    paper_title = paper["title"]
+    paper_url = paper["url"]
+    paper_first_author = paper["first_author"]
+    publish_time = paper["publish_time"]
+    repo_url = paper["repo_url"]
+
+    if summary_text:
+        title_cell = f"**{paper_title}**<br><br>{summary_text}"
+    else:
+        title_cell = f"**{paper_title}**"
+    if repo_url is not None:
+        content = "|**{}**|{}|{} et.al.|[{}]({})|**[link]({})**|\n".format(
+               publish_time,title_cell,paper_first_author,paper_key,paper_url,repo_url)
+        content_to_web = "- {}, **{}**, {} et.al., Paper: [{}]({}), Code: **[{}]({})**".format(
+               publish_time,paper_title,paper_first_author,paper_url,paper_url,repo_url,repo_url)
+    else:
+        content = "|**{}**|{}|{} et.al.|[{}]({})|null|\n".format(
+               publish_time,title_cell,paper_first_author,paper_key,paper_url)
+        content_to_web = "- {}, **{}**, {} et.al., Paper: [{}]({})".format(
+               publish_time,paper_title,paper_first_author,paper_url,paper_url)
+
+    # TODO: select useful comments
+    comments = None
+    if comments != None:
+        content_to_web += f", {comments}\n"
+    else:
+        content_to_web += f"\n"
+    return content, content_to_web
+
+async def get_daily_papers(http,topic,query="slam", max_results=2):
+    """
+    @param http: aiohttp.ClientSession
+    @param topic: str
+    @param query: str
+    @return paper_with_code: dict
+    """
+    # output
+    content = dict()
+    content_to_web = dict()
+
+    records = await search_today_papers(http, query, max_results)
+
+    # 1) Download PDFs and code links, papers are independent
+    papers = await asyncio.gather(*[fetch_paper(http, record) for record in records])
+    papers = [paper for paper in papers if paper is not None]
+
+    # 2) Summarize with qwen-long in batches, each batch settles before the next
+    summaries = dict()
+    pdfs = [(paper["key"], paper["pdf_path"]) for paper in papers if paper["pdf_path"]]
+    for batch in chunks(pdfs, QWEN_LONG_CONCURRENCY):
+        texts = await asyncio.gather(*[summarize_pdf_with_qwen_long_async(pdf_path) for _, pdf_path in batch],
+                                     return_exceptions=True)
+        for (paper_key, _), text in zip(batch, texts):
+            if isinstance(text, BaseException):
+                logging.warning(f"Summarization failed for {paper_key}: {text}")
+                continue
+            summaries[paper_key] = text
+
+    for paper in papers:
+        paper_key = paper["key"]
+        content[paper_key], content_to_web[paper_key] = format_paper_rows(
+            paper, summaries.get(paper_key))
 
     data = {topic:content}
     data_web = {topic:content_to_web}
     return data,data_web
 
-def update_paper_links(filename):
+async def get_all_daily_papers(keywords, max_results):
+    """
+    Fetch all topics concurrently over one shared aiohttp session.
+    @param keywords: dict of topic -> query
+    @param max_results: int
+    @return list of (data, data_web), in keywords order
+    """
+    if not SUMMARIZATION_ENABLED:
+        logging.warning("openai package or DASHSCOPE_API_KEY not available; skipping PDF download and summarization")
+    # limits and tasks from a previous asyncio.run belong to its event loop
+    _reset_run_state()
+    connector = aiohttp.TCPConnector(limit_per_host=HOST_CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector) as http:
+        tasks = [get_daily_papers(http, topic, query = keyword, max_results = max_results)
+                 for topic, keyword in keywords.items()]
+        return await asyncio.gather(*tasks)
+
+def update_paper_links(m):
     '''
-    weekly update paper links in json file
+    weekly update paper links in json data
+    @param m: dict loaded by load_store
+    @return json_data: dict
     '''
     def parse_arxiv_string(s):
         parts = s.split("|")
@@ -320,57 +817,67 @@ def update_paper_links(filename):
         arxiv_id = re.sub(r'v\d+', '', arxiv_id)
         return date,title,authors,arxiv_id,code
 
-    with open(filename,"r", encoding='utf-8') as f:
-        content = f.read()
-        if not content:
-            m = {}
-        else:
-            m = json.loads(content)
+    def lookup_repo_url(paper_id):
+        try:
+            code_url = base_url + paper_id  # TODO
+            r = cached_get_json(code_url)
+            if r and "official" in r and r["official"]:
+                return r["official"]["url"]
+        except Exception as e:
+            logging.warning(f"Update code link failed: {e} with id: {paper_id}")
+        return None
 
-        json_data = m.copy()
+    json_data = m.copy()
+    # paper_id -> keywords whose entry has no code link yet
+    missing = dict()
 
-        for keywords,v in json_data.items():
-            logging.info(f'keywords = {keywords}')
-            for paper_id,contents in v.items():
-                contents = str(contents)
+    for keywords,v in json_data.items():
+        logging.info(f'keywords = {keywords}')
+        for paper_id,contents in v.items():
+            contents = str(contents)
 
-                update_time, paper_title, paper_first_author, paper_url, code_url = parse_arxiv_string(contents)
+            update_time, paper_title, paper_first_author, paper_url, code_url = parse_arxiv_string(contents)
 
-                contents = "|{}|{}|{}|{}|{}|\n".format(update_time,paper_title,paper_first_author,paper_url,code_url)
-                json_data[keywords][paper_id] = str(contents)
-                logging.info(f'paper_id = {paper_id}, contents = {contents}')
+            contents = "|{}|{}|{}|{}|{}|\n".format(update_time,paper_title,paper_first_author,paper_url,code_url)
+            json_data[keywords][paper_id] = str(contents)
+            logging.info(f'paper_id = {paper_id}, contents = {contents}')
 
-                valid_link = False if '|null|' in contents else True
-                if valid_link:
-                    continue
-                try:
-                    code_url = base_url + paper_id  # TODO
-                    r = get_json_with_retries(code_url)
-                    repo_url = None
-                    if r and "official" in r and r["official"]:
-                        repo_url = r["official"]["url"]
-                        if repo_url is not None:
-                            new_cont = contents.replace('|null|', f'|**[link]({repo_url})**|')
-                            logging.info(f'ID = {paper_id}, contents = {new_cont}')
-                            json_data[keywords][paper_id] = str(new_cont)
-
-                except Exception as e:
-                    logging.warning(f"Update code link failed: {e} with id: {paper_id}")
-        # dump to json file
-        with open(filename,"w", encoding='utf-8') as f:
-            json.dump(json_data,f, ensure_ascii=False)
-
-def update_json_file(filename,data_dict):
+            if '|null|' in contents:
+                missing.setdefault(paper_id, []).append(keywords)
+
+    # look up every missing link once, concurrently
+    with ThreadPoolExecutor(max_workers=LINK_UPDATE_WORKERS) as executor:
+        repo_urls = executor.map(lookup_repo_url, missing)
+        for paper_id, repo_url in zip(missing, repo_urls):
+            if repo_url is None:
+                continue
+            for keywords in missing[paper_id]:
+                contents = json_data[keywords][paper_id]
+                new_cont = contents.replace('|null|', f'|**[link]({repo_url})**|')
+                logging.info(f'ID = {paper_id}, contents = {new_cont}')
+                json_data[keywords][paper_id] = str(new_cont)
+    return json_data
+
+def load_store(filename) -> dict:
     '''
-    daily update json file using data_dict
+    read the json paper store, an empty file gives an empty dict
     '''
-    with open(filename,"r", encoding='utf-8') as f:
+    with open(filename,"rb") as f:
         content = f.read()
-        if not content:
-            m = {}
-        else:
-            m = json.loads(content)
+    if not content:
+        return {}
+    return orjson.loads(content)
+
+def save_store(filename,json_data) -> None:
+    with open(filename,"wb") as f:
+        f.write(orjson.dumps(json_data))
 
+def update_json_file(m,data_dict):
+    '''
+    daily update json data using data_dict
+    @param m: dict loaded by load_store
+    @return json_data: dict
+    '''
     json_data = m.copy()
 
     # update papers in each keywords
@@ -381,12 +888,11 @@ def update_json_file(filename,data_dict):
             if keyword in json_data.keys():
                 json_data[keyword].update(papers)
             else:
-                json_data[keyword] = papers
+                json_data[keyword] = dict(papers)
 
-    with open(filename,"w", encoding='utf-8') as f:
-        json.dump(json_data,f, ensure_ascii=False)
+    return json_data
 
-def json_to_md(filename,md_filename,
+def json_to_md(data,md_filename,
                task = '',
                to_web = False,
                use_title = True,
@@ -394,13 +900,13 @@ def json_to_md(filename,md_filename,
                show_badge = True,
                use_b2t = True):
     """
-    @param filename: str
+    @param data: dict, or path of the json file to load
     @param md_filename: str
     @return None
     """
     def pretty_math(s:str) -> str:
         ret = ''
-        match = re.search(r"\$.*\$", s)
+        match = _MATH_RE.search(s)
         if match == None:
             return s
         math_start,math_end = match.span()
@@ -416,100 +922,93 @@ def json_to_md(filename,md_filename,
     DateNow = str(DateNow)
     DateNow = DateNow.replace('-','.')
 
-    with open(filename,"r", encoding='utf-8') as f:
-        content = f.read()
-        if not content:
-            data = {}
-        else:
-            data = json.loads(content)
-
-    # clean README.md if daily already exist else create it
-    with open(md_filename,"w+", encoding='utf-8') as f:
-        pass
-
-    # write data into README.md
-    with open(md_filename,"a+", encoding='utf-8') as f:
+    if isinstance(data, str):
+        data = load_store(data)
 
-        if (use_title == True) and (to_web == True):
-            f.write("---\n" + "layout: default\n" + "---\n\n")
+    # (keyword, anchor, papers) for every non-empty keyword, shared by TOC and body
+    sections = [(keyword, keyword.replace(' ','-').lower(), data[keyword])
+                for keyword in data if data[keyword]]
 
-        if show_badge == True:
-            f.write(f"[![Contributors][contributors-shield]][contributors-url]\n")
-            f.write(f"[![Forks][forks-shield]][forks-url]\n")
-            f.write(f"[![Stargazers][stars-shield]][stars-url]\n")
-            f.write(f"[![Issues][issues-shield]][issues-url]\n\n")
+    # collect the whole document, then write README.md in one go
+    parts = []
 
-        if use_title == True:
-            #f.write(("<p align="center"><h1 align="center"><br><ins>CV-ARXIV-DAILY"
-            #         "</ins><br>Automatically Update CV Papers Daily</h1></p>\n"))
-            f.write("## Updated on " + DateNow + "\n")
-        else:
-            f.write("> Updated on " + DateNow + "\n")
-
-        # TODO: add usage
-        f.write("> Usage instructions: [here](./docs/README.md#usage)\n\n")
-
-        #Add: table of contents
-        if use_tc == True:
-            f.write("<details>\n")
-            f.write("  <summary>Table of Contents</summary>\n")
-            f.write("  <ol>\n")
-            for keyword in data.keys():
-                day_content = data[keyword]
-                if not day_content:
-                    continue
-                kw = keyword.replace(' ','-')
-                f.write(f"    <li><a href=#{kw.lower()}>{keyword}</a></li>\n")
-            f.write("  </ol>\n")
-            f.write("</details>\n\n")
+    if (use_title == True) and (to_web == True):
+        parts.append("---\n" + "layout: default\n" + "---\n\n")
 
-        for keyword in data.keys():
-            day_content = data[keyword]
-            if not day_content:
-                continue
-            # the head of each part
-            f.write(f"## {keyword}\n\n")
+    if show_badge == True:
+        parts.append(f"[![Contributors][contributors-shield]][contributors-url]\n")
+        parts.append(f"[![Forks][forks-shield]][forks-url]\n")
+        parts.append(f"[![Stargazers][stars-shield]][stars-url]\n")
+        parts.append(f"[![Issues][issues-shield]][issues-url]\n\n")
 
-            if use_title == True :
-                if to_web == False:
-                    f.write("|Publish Date|Title|Authors|PDF|Code|\n" + "|---|---|---|---|---|\n")
-                else:
-                    f.write("| Publish Date | Title | Authors | PDF | Code |\n")
-                    f.write("|:---------|:-----------------------|:---------|:------|:------|\n")
-
-            # sort papers by date
-            day_content = sort_papers(day_content)
-
-            for _,v in day_content.items():
-                if v is not None:
-                    f.write(pretty_math(v)) # make latex pretty
-
-            f.write(f"\n")
-
-            #Add: back to top
-            if use_b2t:
-                top_info = f"#Updated on {DateNow}"
-                top_info = top_info.replace(' ','-').replace('.','')
-                f.write(f"<p align=right>(<a href={top_info.lower()}>back to top</a>)</p>\n\n")
-
-        if show_badge == True:
-            # we don't like long string, break it!
-            f.write((f"[contributors-shield]: https://img.shields.io/github/"
-                     f"contributors/Vincentqyw/cv-arxiv-daily.svg?style=for-the-badge\n"))
-            f.write((f"[contributors-url]: https://github.com/Vincentqyw/"
-                     f"cv-arxiv-daily/graphs/contributors\n"))
-            f.write((f"[forks-shield]: https://img.shields.io/github/forks/Vincentqyw/"
-                     f"cv-arxiv-daily.svg?style=for-the-badge\n"))
-            f.write((f"[forks-url]: https://github.com/Vincentqyw/"
-                     f"cv-arxiv-daily/network/members\n"))
-            f.write((f"[stars-shield]: https://img.shields.io/github/stars/Vincentqyw/"
-                     f"cv-arxiv-daily.svg?style=for-the-badge\n"))
-            f.write((f"[stars-url]: https://github.com/Vincentqyw/"
-                     f"cv-arxiv-daily/stargazers\n"))
-            f.write((f"[issues-shield]: https://img.shields.io/github/issues/Vincentqyw/"
-                     f"cv-arxiv-daily.svg?style=for-the-badge\n"))
-            f.write((f"[issues-url]: https://github.com/Vincentqyw/"
-                     f"cv-arxiv-daily/issues\n\n"))
+    if use_title == True:
+        #parts.append(("<p align="center"><h1 align="center"><br><ins>CV-ARXIV-DAILY"
+        #         "</ins><br>Automatically Update CV Papers Daily</h1></p>\n"))
+        parts.append("## Updated on " + DateNow + "\n")
+    else:
+        parts.append("> Updated on " + DateNow + "\n")
+
+    # TODO: add usage
+    parts.append("> Usage instructions: [here](./docs/README.md#usage)\n\n")
+
+    #Add: table of contents
+    if use_tc == True:
+        parts.append("<details>\n")
+        parts.append("  <summary>Table of Contents</summary>\n")
+        parts.append("  <ol>\n")
+        for keyword, anchor, _ in sections:
+            parts.append(f"    <li><a href=#{anchor}>{keyword}</a></li>\n")
+        parts.append("  </ol>\n")
+        parts.append("</details>\n\n")
+
+    for keyword, _, day_content in sections:
+        # the head of each part
+        parts.append(f"## {keyword}\n\n")
+
+        if use_title == True :
+            if to_web == False:
+                parts.append("|Publish Date|Title|Authors|PDF|Code|\n" + "|---|---|---|---|---|\n")
+            else:
+                parts.append("| Publish Date | Title | Authors | PDF | Code |\n")
+                parts.append("|:---------|:-----------------------|:---------|:------|:------|\n")
+
+        # sort papers by date
+        day_content = sort_papers(day_content)
+
+        for _,v in day_content.items():
+            if v is not None:
+                parts.append(pretty_math(v)) # make latex pretty
+
+        parts.append(f"\n")
+
+        #Add: back to top
+        if use_b2t:
+            top_info = f"#Updated on {DateNow}"
+            top_info = top_info.replace(' ','-').replace('.','')
+            parts.append(f"<p align=right>(<a href={top_info.lower()}>back to top</a>)</p>\n\n")
+
+    if show_badge == True:
+        # we don't like long string, break it!
+        parts.append((f"[contributors-shield]: https://img.shields.io/github/"
+                      f"contributors/Vincentqyw/cv-arxiv-daily.svg?style=for-the-badge\n"))
+        parts.append((f"[contributors-url]: https://github.com/Vincentqyw/"
+                      f"cv-arxiv-daily/graphs/contributors\n"))
+        parts.append((f"[forks-shield]: https://img.shields.io/github/forks/Vincentqyw/"
+                      f"cv-arxiv-daily.svg?style=for-the-badge\n"))
+        parts.append((f"[forks-url]: https://github.com/Vincentqyw/"
+                      f"cv-arxiv-daily/network/members\n"))
+        parts.append((f"[stars-shield]: https://img.shields.io/github/stars/Vincentqyw/"
+                      f"cv-arxiv-daily.svg?style=for-the-badge\n"))
+        parts.append((f"[stars-url]: https://github.com/Vincentqyw/"
+                      f"cv-arxiv-daily/stargazers\n"))
+        parts.append((f"[issues-shield]: https://img.shields.io/github/issues/Vincentqyw/"
+                      f"cv-arxiv-daily.svg?style=for-the-badge\n"))
+        parts.append((f"[issues-url]: https://github.com/Vincentqyw/"
+                      f"cv-arxiv-daily/issues\n\n"))
+
+    # overwrite README.md if daily already exist else create it
+    with open(md_filename,"w", encoding='utf-8') as f:
+        f.write("".join(parts))
 
     logging.info(f"{task} finished")
 
@@ -529,27 +1028,34 @@ def demo(**config):
     logging.info(f'Update Paper Link = {b_update}')
     if config['update_paper_links'] == False:
         logging.info(f"GET daily papers begin")
-        for topic, keyword in keywords.items():
-            logging.info(f"Keyword: {topic}")
-            data, data_web = get_daily_papers(topic, query = keyword,
-                                            max_results = max_results)
+        logging.info(f"Keywords: {list(keywords.keys())}")
+        results = asyncio.run(get_all_daily_papers(keywords, max_results))
+        for data, data_web in results:
             data_collector.append(data)
             data_collector_web.append(data_web)
-            print("\n")
         logging.info(f"GET daily papers end")
 
+    # each json store is read once and shared by every output using it
+    stores = dict()
+    def update_store(json_file, collector):
+        if json_file not in stores:
+            stores[json_file] = load_store(json_file)
+        if config['update_paper_links']:
+            # update paper links
+            stores[json_file] = update_paper_links(stores[json_file])
+        else:
+            # update json data
+            stores[json_file] = update_json_file(stores[json_file], collector)
+        save_store(json_file, stores[json_file])
+        return stores[json_file]
+
     # 1. update README.md file
     if publish_readme:
         json_file = config['json_readme_path']
         md_file   = config['md_readme_path']
-        # update paper links
-        if config['update_paper_links']:
-            update_paper_links(json_file)
-        else:
-            # update json data
-            update_json_file(json_file,data_collector)
+        json_data = update_store(json_file, data_collector)
         # json data to markdown
-        json_to_md(json_file,md_file, task ='Update Readme', \
+        json_to_md(json_data,md_file, task ='Update Readme', \
             show_badge = show_badge)
 
     # 2. update docs/index.md file (to gitpage)
@@ -557,11 +1063,8 @@ def demo(**config):
         json_file = config['json_gitpage_path']
         md_file   = config['md_gitpage_path']
         # TODO: duplicated update paper links!!!
-        if config['update_paper_links']:
-            update_paper_links(json_file)
-        else:
-            update_json_file(json_file,data_collector)
-        json_to_md(json_file, md_file, task ='Update GitPage', \
+        json_data = update_store(json_file, data_collector)
+        json_to_md(json_data, md_file, task ='Update GitPage', \
             to_web = True, show_badge = show_badge, \
             use_tc=False, use_b2t=False)
 
@@ -570,11 +1073,8 @@ def demo(**config):
         json_file = config['json_wechat_path']
         md_file   = config['md_wechat_path']
         # TODO: duplicated update paper links!!!
-        if config['update_paper_links']:
-            update_paper_links(json_file)
-        else:
-            update_json_file(json_file, data_collector_web)
-        json_to_md(json_file, md_file, task ='Update Wechat', \
+        json_data = update_store(json_file, data_collector_web)
+        json_to_md(json_data, md_file, task ='Update Wechat', \
             to_web=False, use_title= False, show_badge = show_badge)
 
 if __name__ == "__main__":